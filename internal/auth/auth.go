@@ -2,26 +2,59 @@ package auth
 
 import (
 	"context"
+	"crypto/hmac"
 	"crypto/md5"
+	"crypto/rand"
+	"crypto/sha256"
 	"crypto/subtle"
 	"encoding/hex"
 	"net"
+	"sync"
+	"time"
 
-	"github.com/moroz/uuidv7-go"
 	"golang.org/x/crypto/bcrypt"
 )
 
+const (
+	// how long a successful bcrypt check is remembered
+	verifiedTTL = time.Minute
+	// upper bound on remembered checks
+	verifiedMaxSize = 1024
+)
+
 type AuthService struct {
 	repo UserRepo
+
+	// verified remembers successful password checks, because OPDS clients
+	// send basic auth on every request and bcrypt is slow by design.
+	// Keys are HMAC-SHA256 of hashed password + password under a random
+	// per-process key, plain passwords are never kept.
+	mu          sync.Mutex
+	verified    map[[sha256.Size]byte]time.Time
+	verifiedMAC [32]byte
 }
 
+var _ AuthInterface = (*AuthService)(nil)
+
 func InitAuthService(repo UserRepo, username, password string) *AuthService {
-	auth := &AuthService{repo: repo}
+	auth := &AuthService{
+		repo:     repo,
+		verified: make(map[[sha256.Size]byte]time.Time),
+	}
+	if _, err := rand.Read(auth.verifiedMAC[:]); err != nil {
+		panic(err)
+	}
 	auth.RegisterUser(context.Background(), username, password)
 	return auth
 }
 
 func (a *AuthService) RegisterUser(ctx context.Context, username, password string) error {
+	// bcrypt at this cost is expensive; skip it when the user is already
+	// there, which is the common case for the configured user on restart.
+	if _, err := a.repo.GetUserByUsername(ctx, username); err == nil {
+		return UserAlreadyCreated
+	}
+
 	hashedPassword, err := hashPassword(password)
 	if err != nil {
 		return err
@@ -39,7 +72,7 @@ func (a *AuthService) CheckPassword(ctx context.Context, username string, passwo
 	if err != nil {
 		return false
 	}
-	return comparePasswords(user.HashedPassword, password)
+	return a.comparePasswords(user.HashedPassword, password)
 }
 
 func (a *AuthService) Login(ctx context.Context, username string, password string, userAgent string, clientIP net.IP) (string, error) {
@@ -49,11 +82,14 @@ func (a *AuthService) Login(ctx context.Context, username string, password strin
 		return "", IncorrectPassword
 	}
 
-	if !comparePasswords(user.HashedPassword, password) {
+	if !a.comparePasswords(user.HashedPassword, password) {
 		return "", IncorrectPassword
 	}
 
-	sessionKey := uuidv7.Generate().String()
+	sessionKey, err := generateSessionKey()
+	if err != nil {
+		return "", err
+	}
 	err = a.repo.StoreSession(ctx, username, sessionKey, userAgent, clientIP)
 	if err != nil {
 		return "", err
@@ -62,10 +98,18 @@ func (a *AuthService) Login(ctx context.Context, username string, password strin
 }
 
 func (a *AuthService) Logout(ctx context.Context, sessionKey string) error {
+	a.mu.Lock()
+	clear(a.verified)
+	a.mu.Unlock()
+
 	return a.repo.DeleteSession(ctx, sessionKey)
 }
 
 func (a *AuthService) IsAuthenticated(ctx context.Context, sessionKey string) bool {
+	// logout leaves an empty session cookie, no need to ask repo
+	if sessionKey == "" {
+		return false
+	}
 	_, err := a.repo.GetUserBySession(ctx, sessionKey)
 	return err == nil
 }
@@ -108,8 +152,59 @@ func hashPassword(password string) (string, error) {
 	return string(bytes), err
 }
 
-func comparePasswords(hashedPassword, password string) bool {
-	return bcrypt.CompareHashAndPassword([]byte(hashedPassword), []byte(password)) == nil
+// comparePasswords checks password against bcrypt hash.
+// Only successful checks are cached, so failed attempts always pay the full bcrypt cost.
+func (a *AuthService) comparePasswords(hashedPassword, password string) bool {
+	key := a.verifiedKey(hashedPassword, password)
+	now := time.Now()
+
+	a.mu.Lock()
+	verifiedAt, ok := a.verified[key]
+	if ok && now.Sub(verifiedAt) >= verifiedTTL {
+		delete(a.verified, key)
+		ok = false
+	}
+	a.mu.Unlock()
+	if ok {
+		return true
+	}
+
+	if bcrypt.CompareHashAndPassword([]byte(hashedPassword), []byte(password)) != nil {
+		return false
+	}
+
+	a.mu.Lock()
+	defer a.mu.Unlock()
+	if len(a.verified) >= verifiedMaxSize {
+		for k, t := range a.verified {
+			if now.Sub(t) >= verifiedTTL {
+				delete(a.verified, k)
+			}
+		}
+		if len(a.verified) >= verifiedMaxSize {
+			clear(a.verified)
+		}
+	}
+	a.verified[key] = now
+	return true
+}
+
+// verifiedKey identifies a checked hashed password and password pair.
+func (a *AuthService) verifiedKey(hashedPassword, password string) [sha256.Size]byte {
+	var key [sha256.Size]byte
+	mac := hmac.New(sha256.New, a.verifiedMAC[:])
+	mac.Write([]byte(hashedPassword + "\x00" + password))
+	mac.Sum(key[:0])
+	return key
+}
+
+// generateSessionKey returns 128 random bits as 32 hex chars.
+func generateSessionKey() (string, error) {
+	var key [16]byte
+	if _, err := rand.Read(key[:]); err != nil {
+		return "", err
+	}
+	return hex.EncodeToString(key[:]), nil
 }
 
 func hashSyncPassword(sync_password string) string {
@@ -0,0 +1,52 @@
+package auth
+
+import (
+	"context"
+	"testing"
+	"time"
+)
+
+func TestAuthServiceVerifiedCache(t *testing.T) {
+	ctx := context.Background()
+
+	a := InitAuthService(NewMemoryUserRepo(), "user", "password")
+	user, err := a.repo.GetUserByUsername(ctx, "user")
+	if err != nil {
+		t.Fatalf("GetUserByUsername failed: %v", err)
+	}
+
+	if a.CheckPassword(ctx, "user", "wrong") {
+		t.Fatal("CheckPassword accepted wrong password")
+	}
+	if _, ok := a.verified[a.verifiedKey(user.HashedPassword, "wrong")]; ok {
+		t.Error("failed check was cached")
+	}
+
+	if !a.CheckPassword(ctx, "user", "password") {
+		t.Fatal("CheckPassword failed")
+	}
+	if _, ok := a.verified[a.verifiedKey(user.HashedPassword, "password")]; !ok {
+		t.Error("successful check was not cached")
+	}
+
+	// an expired entry is dropped on lookup and bcrypt decides again
+	key := a.verifiedKey(user.HashedPassword, "wrong")
+	a.verified[key] = time.Now().Add(-verifiedTTL)
+	if a.CheckPassword(ctx, "user", "wrong") {
+		t.Fatal("CheckPassword accepted expired wrong password")
+	}
+	if _, ok := a.verified[key]; ok {
+		t.Error("expired check was not dropped")
+	}
+
+	sessionKey, err := a.Login(ctx, "user", "password", "user-agent", nil)
+	if err != nil {
+		t.Fatalf("Login failed: %v", err)
+	}
+	if err := a.Logout(ctx, sessionKey); err != nil {
+		t.Fatalf("Logout failed: %v", err)
+	}
+	if len(a.verified) != 0 {
+		t.Errorf("Logout left %d cached checks", len(a.verified))
+	}
+}
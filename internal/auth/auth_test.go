@@ -50,4 +50,57 @@ func TestAuthServiceUserLogin(t *testing.T) {
 	if !auth.IsAuthenticated(ctx, sessionKey) {
 		t.Error("IsAuthenticated failed")
 	}
+
+	if auth.IsAuthenticated(ctx, "") {
+		t.Error("IsAuthenticated accepted empty session")
+	}
+}
+
+func TestAuthServiceCheckPassword(t *testing.T) {
+	ctx := context.Background()
+
+	memory_repo := auth.NewMemoryUserRepo()
+	auth := auth.InitAuthService(memory_repo, "user", "password")
+
+	// second call is served from verified cache
+	for i := 0; i < 2; i++ {
+		if !auth.CheckPassword(ctx, "user", "password") {
+			t.Error("CheckPassword failed")
+		}
+	}
+
+	if auth.CheckPassword(ctx, "user", "wrong") {
+		t.Error("CheckPassword accepted wrong password")
+	}
+
+	if auth.CheckPassword(ctx, "unknown", "password") {
+		t.Error("CheckPassword accepted unknown user")
+	}
+}
+
+func TestAuthServiceCheckDevicePassword(t *testing.T) {
+	ctx := context.Background()
+
+	memory_repo := auth.NewMemoryUserRepo()
+	auth := auth.InitAuthService(memory_repo, "user", "password")
+
+	err := auth.AddUserDevice(ctx, "device", "secret")
+	if err != nil {
+		t.Fatalf("AddUserDevice failed: %v", err)
+	}
+
+	// md5("secret") as sent by KOReader sync
+	hashed := "5ebe2294ecd0e0f08eab7690d2a6ee69"
+	if !auth.CheckDevicePassword(ctx, "device", "secret", true) {
+		t.Error("CheckDevicePassword failed for plain password")
+	}
+	if !auth.CheckDevicePassword(ctx, "device", hashed, false) {
+		t.Error("CheckDevicePassword failed for hashed password")
+	}
+	if auth.CheckDevicePassword(ctx, "device", "wrong", true) {
+		t.Error("CheckDevicePassword accepted wrong password")
+	}
+	if auth.CheckDevicePassword(ctx, "unknown", "secret", true) {
+		t.Error("CheckDevicePassword accepted unknown device")
+	}
 }
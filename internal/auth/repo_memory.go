@@ -2,21 +2,22 @@ package auth
 
 import (
 	"context"
-	"errors"
 	"net"
 	"sync"
 )
 
 type MemoryRepo struct {
 	user     User
-	sessions map[string]bool
+	sessions map[string]struct{}
 	devices  map[string]Device
 	mu       sync.RWMutex
 }
 
+var _ UserRepo = (*MemoryRepo)(nil)
+
 func NewMemoryUserRepo() *MemoryRepo {
 	return &MemoryRepo{
-		sessions: make(map[string]bool),
+		sessions: make(map[string]struct{}),
 		devices:  make(map[string]Device),
 	}
 }
@@ -46,7 +47,7 @@ func (mr *MemoryRepo) GetUserBySession(ctx context.Context, sessionKey string) (
 	mr.mu.RLock()
 	defer mr.mu.RUnlock()
 
-	if !mr.sessions[sessionKey] {
+	if _, ok := mr.sessions[sessionKey]; !ok {
 		return User{}, SessionNotFound
 	}
 	return mr.user, nil
@@ -60,7 +61,7 @@ func (mr *MemoryRepo) StoreSession(ctx context.Context, username, sessionKey, us
 		return UserNotFound
 	}
 
-	mr.sessions[sessionKey] = true
+	mr.sessions[sessionKey] = struct{}{}
 	return nil
 }
 
@@ -68,7 +69,7 @@ func (mr *MemoryRepo) DeleteSession(ctx context.Context, sessionKey string) erro
 	mr.mu.Lock()
 	defer mr.mu.Unlock()
 
-	if !mr.sessions[sessionKey] {
+	if _, ok := mr.sessions[sessionKey]; !ok {
 		return SessionNotFound
 	}
 	delete(mr.sessions, sessionKey)
@@ -92,7 +93,7 @@ func (mr *MemoryRepo) GetDeviceByName(ctx context.Context, deviceName string) (D
 
 	device, ok := mr.devices[deviceName]
 	if !ok {
-		return Device{}, errors.New("not found")
+		return Device{}, DeviceNotFound
 	}
 	return device, nil
 }
@@ -102,7 +103,7 @@ func (mr *MemoryRepo) DeleteDevice(ctx context.Context, deviceName string) error
 	defer mr.mu.Unlock()
 
 	if _, ok := mr.devices[deviceName]; !ok {
-		return errors.New("not found")
+		return DeviceNotFound
 	}
 	delete(mr.devices, deviceName)
 	return nil
@@ -2,6 +2,7 @@ package auth
 
 import (
 	"context"
+	"errors"
 	"testing"
 )
 
@@ -107,6 +108,20 @@ func TestDeleteSession(t *testing.T) {
 	}
 }
 
+func TestDeviceNotFound(t *testing.T) {
+	_, memoryRepo := testInitMemoryRepo("test")
+	ctx := context.Background()
+
+	_, err := memoryRepo.GetDeviceByName(ctx, "notfound")
+	if !errors.Is(err, DeviceNotFound) {
+		t.Fatalf("Expected DeviceNotFound, got %v", err)
+	}
+	err = memoryRepo.DeleteDevice(ctx, "notfound")
+	if !errors.Is(err, DeviceNotFound) {
+		t.Fatalf("Expected DeviceNotFound, got %v", err)
+	}
+}
+
 func testInitMemoryRepo(username string) (User, *MemoryRepo) {
 	password := "test"
 
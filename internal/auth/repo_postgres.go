@@ -12,6 +12,8 @@ type UserDatabaseRepo struct {
 	*postgres.Postgres
 }
 
+var _ UserRepo = (*UserDatabaseRepo)(nil)
+
 func NewUserDatabaseRepo(pg *postgres.Postgres) *UserDatabaseRepo {
 	return &UserDatabaseRepo{pg}
 }
@@ -90,7 +92,12 @@ func (r *UserDatabaseRepo) GetUserBySession(ctx context.Context, sessionKey stri
 }
 
 func (r *UserDatabaseRepo) DeleteSession(ctx context.Context, sessionKey string) error {
-	sql := `UPDATE auth_session SET is_active = false WHERE session_key = $1`
+	sql := `
+		UPDATE auth_session
+		SET is_active = false,
+			deactivated_at = NOW()
+		WHERE session_key = $1 AND is_active
+	`
 	args := []interface{}{sessionKey}
 
 	_, err := r.Pool.Exec(ctx, sql, args...)
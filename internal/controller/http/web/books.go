@@ -1,6 +1,7 @@
 package web
 
 import (
+	"errors"
 	"fmt"
 	"os"
 	"strconv"
@@ -51,16 +52,19 @@ func (r *booksRoutes) listBooks(c *gin.Context) {
 		entity.Book
 		Progress int
 	}
+	documentIDs := make([]string, len(books.Books))
+	for i, book := range books.Books {
+		documentIDs[i] = book.DocumentID
+	}
+	progress, err := r.progress.FetchMany(c.Request.Context(), documentIDs)
+	if err != nil {
+		r.logger.Error(err, "failed to fetch progress for books")
+	}
 	booksWithProgress := make([]BookWithProgress, len(books.Books))
 	for i, book := range books.Books {
-		progress, err := r.progress.Fetch(c.Request.Context(), book.DocumentID)
-		if err != nil {
-			r.logger.Error(err, "failed to fetch progress for book %s", book.ID)
-			progress = entity.Progress{}
-		}
 		booksWithProgress[i] = BookWithProgress{
 			Book:     book,
-			Progress: int(progress.Percentage * 100),
+			Progress: int(progress[book.DocumentID].Percentage * 100),
 		}
 	}
 
@@ -172,14 +176,12 @@ func (r *booksRoutes) updateBookMetadata(c *gin.Context) {
 func (r *booksRoutes) viewBookCover(c *gin.Context) {
 	bookID := c.Param("bookID")
 
-	book, err := r.shelf.ViewBook(c.Request.Context(), bookID)
-	if err != nil {
+	book, cover, err := r.shelf.ViewCover(c.Request.Context(), bookID)
+	if err != nil && !errors.Is(err, library.ErrNoCover) {
 		c.JSON(500, passStandartContext(c, gin.H{"message": "internal server error"}))
 		return
 	}
 
-	cover, err := r.shelf.ViewCover(c.Request.Context(), bookID)
-
 	if err != nil {
 		width := 600
 		height := 800
@@ -16,16 +16,13 @@ func generateDailyStatsChart(stats []stats.DailyStats) ([]byte, error) {
 	yPagesValues := make([]float64, len(stats))
 	yDurationValues := make([]float64, len(stats))
 
+	// Fill series and find max values for both Y axes in one pass
+	maxPages := 0.0
+	maxDuration := 0.0
 	for i, stat := range stats {
 		xValues[i] = float64(stat.Date.Unix())
 		yPagesValues[i] = float64(stat.PageCount)
 		yDurationValues[i] = float64(int(stat.AvgDurationPerPage))
-	}
-
-	// Find max values for both Y axes
-	maxPages := 0.0
-	maxDuration := 0.0
-	for i := range stats {
 		if yPagesValues[i] > maxPages {
 			maxPages = yPagesValues[i]
 		}
@@ -25,8 +25,7 @@ type Book struct {
 }
 
 func (b Book) extension() string {
-	tmp := strings.Split(b.FilePath, ".")
-	return tmp[len(tmp)-1]
+	return b.FilePath[strings.LastIndexByte(b.FilePath, '.')+1:]
 }
 
 func (b Book) Filename() string {
@@ -2,18 +2,24 @@ package library
 
 import (
 	"context"
+	"errors"
 	"fmt"
-	"strings"
 
+	"github.com/jackc/pgx/v5/pgconn"
 	"github.com/vanadium23/kompanion/internal/entity"
 	"github.com/vanadium23/kompanion/pkg/postgres"
 )
 
+// uniqueViolation is the SQLSTATE postgres reports for unique_violation.
+const uniqueViolation = "23505"
+
 // BookDatabaseRepo -.
 type BookDatabaseRepo struct {
 	*postgres.Postgres
 }
 
+var _ BookRepo = (*BookDatabaseRepo)(nil)
+
 // New -.
 func NewBookDatabaseRepo(pg *postgres.Postgres) *BookDatabaseRepo {
 	return &BookDatabaseRepo{pg}
@@ -33,7 +39,8 @@ func (bdr *BookDatabaseRepo) Store(ctx context.Context, book entity.Book) error
 
 	_, err := bdr.Pool.Exec(ctx, sql, args...)
 	if err != nil {
-		if strings.Contains(err.Error(), "duplicate key value violates unique constraint") {
+		var pgErr *pgconn.PgError
+		if errors.As(err, &pgErr) && pgErr.Code == uniqueViolation {
 			return fmt.Errorf("BookDatabaseRepo - Store - r.Pool.Exec: %w", entity.ErrBookAlreadyExists)
 		}
 		return fmt.Errorf("BookDatabaseRepo - Store - r.Pool.Exec: %w", err)
@@ -109,7 +116,7 @@ func (bdr *BookDatabaseRepo) List(ctx context.Context,
 	}
 	defer rows.Close()
 
-	books := make([]entity.Book, 0)
+	books := make([]entity.Book, 0, perPage)
 	for rows.Next() {
 		var book entity.Book
 		err = rows.Scan(&book.ID, &book.Title, &book.Author, &book.Publisher, &book.Year, &book.CreatedAt, &book.UpdatedAt, &book.ISBN, &book.FilePath, &book.DocumentID, &book.CoverPath)
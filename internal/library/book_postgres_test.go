@@ -2,9 +2,11 @@ package library_test
 
 import (
 	"context"
+	"errors"
 	"testing"
 	"time"
 
+	"github.com/jackc/pgx/v5/pgconn"
 	"github.com/pashagolub/pgxmock/v4"
 	"github.com/vanadium23/kompanion/internal/entity"
 	"github.com/vanadium23/kompanion/internal/library"
@@ -42,6 +44,34 @@ func TestBookDatabaseRepoCreate(t *testing.T) {
 	}
 }
 
+func TestBookDatabaseRepoCreateDuplicate(t *testing.T) {
+	book := entity.Book{
+		ID:         "1",
+		Title:      "title",
+		Author:     "author",
+		Publisher:  "publisher",
+		Year:       2021,
+		CreatedAt:  time.Now(),
+		UpdatedAt:  time.Now(),
+		ISBN:       "isbn",
+		FilePath:   "file_path",
+		DocumentID: "document_id",
+		CoverPath:  "cover_path",
+	}
+
+	mock, bdr := setupTestBookDatabaseRepo()
+	defer mock.Close()
+
+	mock.ExpectExec("INSERT INTO library_book").
+		WithArgs(book.ID, book.Title, book.Author, book.Publisher, book.Year, book.CreatedAt, book.UpdatedAt, book.ISBN, book.FilePath, book.DocumentID, book.CoverPath).
+		WillReturnError(&pgconn.PgError{Code: "23505"})
+
+	err := bdr.Store(context.Background(), book)
+	if !errors.Is(err, entity.ErrBookAlreadyExists) {
+		t.Errorf("expected ErrBookAlreadyExists, got %v", err)
+	}
+}
+
 func TestBookDatabaseRepoGetById(t *testing.T) {
 	// book
 	book := entity.Book{
@@ -2,11 +2,15 @@ package library
 
 import (
 	"context"
+	"errors"
 	"os"
 
 	"github.com/vanadium23/kompanion/internal/entity"
 )
 
+// ErrNoCover is returned by ViewCover when the book has no readable cover.
+var ErrNoCover = errors.New("no cover")
+
 type (
 	// Shelf -.
 	Shelf interface {
@@ -18,7 +22,7 @@ type (
 		ViewBook(ctx context.Context, bookID string) (entity.Book, error)
 		DownloadBook(ctx context.Context, bookID string) (entity.Book, *os.File, error)
 		UpdateBookMetadata(ctx context.Context, bookID string, metadata entity.Book) (entity.Book, error)
-		ViewCover(ctx context.Context, bookID string) (*os.File, error)
+		ViewCover(ctx context.Context, bookID string) (entity.Book, *os.File, error)
 	}
 
 	// BookRepo -.
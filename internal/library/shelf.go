@@ -22,6 +22,8 @@ type BookShelf struct {
 	logger  logger.Interface
 }
 
+var _ Shelf = (*BookShelf)(nil)
+
 func NewBookShelf(storage storage.Storage, repo BookRepo, l logger.Interface) *BookShelf {
 	return &BookShelf{
 		storage: storage,
@@ -31,7 +33,7 @@ func NewBookShelf(storage storage.Storage, repo BookRepo, l logger.Interface) *B
 }
 
 func (uc *BookShelf) StoreBook(ctx context.Context, tempFile *os.File, uploadedFilename string) (entity.Book, error) {
-	koreaderPartialMD5, err := utils.PartialMD5(tempFile.Name())
+	koreaderPartialMD5, err := utils.PartialMD5FromReader(tempFile)
 	if err != nil {
 		return entity.Book{}, fmt.Errorf("BookShelf - StoreBook - PartialMD5: %w", err)
 	}
@@ -48,9 +50,9 @@ func (uc *BookShelf) StoreBook(ctx context.Context, tempFile *os.File, uploadedF
 		return entity.Book{}, errors.New("BookShelf - StoreBook - unknown file format")
 	}
 
-	bookID := uuidv7.Generate()
+	bookID := uuidv7.Generate().String()
 	createDate := time.Now()
-	storagepath := fmt.Sprintf("%s/%s.%s", createDate.Format("2006/01/02"), bookID, m.Format)
+	storagepath := createDate.Format("2006/01/02") + "/" + bookID + "." + m.Format
 
 	err = uc.storage.Write(ctx, tempFile.Name(), storagepath)
 	if err != nil {
@@ -58,13 +60,13 @@ func (uc *BookShelf) StoreBook(ctx context.Context, tempFile *os.File, uploadedF
 	}
 	uc.logger.Info("BookShelf - StoreBook - documentID: %s", koreaderPartialMD5)
 
-	coverPath, err := writeCover(ctx, uc.storage, m.Cover, bookID.String())
+	coverPath, err := writeCover(ctx, uc.storage, m.Cover, bookID)
 	if err != nil {
 		uc.logger.Error("BookShelf - StoreBook - writeCover: %s", err)
 	}
 
 	book := entity.Book{
-		ID:         bookID.String(),
+		ID:         bookID,
 		Title:      m.Title,
 		Author:     m.Author,
 		Publisher:  m.Publisher,
@@ -157,19 +159,19 @@ func (uc *BookShelf) DownloadBook(ctx context.Context, bookID string) (entity.Bo
 	return book, file, nil
 }
 
-func (uc *BookShelf) ViewCover(ctx context.Context, bookID string) (*os.File, error) {
+func (uc *BookShelf) ViewCover(ctx context.Context, bookID string) (entity.Book, *os.File, error) {
 	book, err := uc.repo.GetById(ctx, bookID)
 	if err != nil {
-		return nil, fmt.Errorf("BookShelf - ViewCover - s.repo.Get: %s", err)
+		return book, nil, fmt.Errorf("BookShelf - ViewCover - s.repo.Get: %w", err)
 	}
 	if book.CoverPath == "" {
-		return nil, fmt.Errorf("BookShelf - ViewCover - no cover")
+		return book, nil, fmt.Errorf("BookShelf - ViewCover: %w", ErrNoCover)
 	}
 	file, err := uc.storage.Read(ctx, book.CoverPath)
 	if err != nil {
-		return nil, fmt.Errorf("BookShelf - ViewCover - s.storage.Read: %s", err)
+		return book, nil, fmt.Errorf("BookShelf - ViewCover - s.storage.Read: %w: %w", ErrNoCover, err)
 	}
-	return file, nil
+	return book, file, nil
 }
 
 func writeCover(
@@ -191,7 +193,7 @@ func writeCover(
 		return "", fmt.Errorf("BookShelf - writeCover - coverTempFile.Write: %w", err)
 	}
 
-	coverpath := fmt.Sprintf("covers/%s.jpg", bookID)
+	coverpath := "covers/" + bookID + ".jpg"
 	err = storage.Write(ctx, coverTempFile.Name(), coverpath)
 	if err != nil {
 		return "", fmt.Errorf("BookShelf - writeCover - s.storage.Write: %w", err)
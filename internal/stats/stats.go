@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"io"
 	"os"
+	"sync"
 	"time"
 
 	"github.com/vanadium23/kompanion/pkg/postgres"
@@ -12,13 +13,81 @@ import (
 
 const KOReaderFile = "statistics.sqlite3"
 
+const (
+	// stats page and its chart ask for the same range on every load
+	statsCacheTTL     = 30 * time.Second
+	statsCacheMaxSize = 256
+)
+
+type statsCacheKey struct {
+	kind     string
+	from, to int64
+}
+
+type statsCacheEntry struct {
+	value   interface{}
+	expires time.Time
+}
+
 // KOReaderPGStats implements ReadingStats interface
 type KOReaderPGStats struct {
 	pg *postgres.Postgres
+
+	mu    sync.Mutex
+	cache map[statsCacheKey]statsCacheEntry
+	// generation is bumped on every invalidate, so a query that raced
+	// with a sync doesn't store its stale result
+	generation uint64
 }
 
+var _ ReadingStats = (*KOReaderPGStats)(nil)
+
 func NewKOReaderPGStats(pg *postgres.Postgres) *KOReaderPGStats {
-	return &KOReaderPGStats{pg: pg}
+	return &KOReaderPGStats{
+		pg:    pg,
+		cache: make(map[statsCacheKey]statsCacheEntry),
+	}
+}
+
+// cached returns the cached value for key, and the generation to pass to store on a miss.
+func (s *KOReaderPGStats) cached(key statsCacheKey) (interface{}, uint64, bool) {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+
+	entry, ok := s.cache[key]
+	if !ok || time.Now().After(entry.expires) {
+		return nil, s.generation, false
+	}
+	return entry.value, s.generation, true
+}
+
+func (s *KOReaderPGStats) store(key statsCacheKey, generation uint64, value interface{}) {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+
+	if generation != s.generation {
+		return
+	}
+	now := time.Now()
+	if len(s.cache) >= statsCacheMaxSize {
+		for k, entry := range s.cache {
+			if now.After(entry.expires) {
+				delete(s.cache, k)
+			}
+		}
+		if len(s.cache) >= statsCacheMaxSize {
+			clear(s.cache)
+		}
+	}
+	s.cache[key] = statsCacheEntry{value: value, expires: now.Add(statsCacheTTL)}
+}
+
+func (s *KOReaderPGStats) invalidate() {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+
+	s.generation++
+	clear(s.cache)
 }
 
 func (s *KOReaderPGStats) Write(ctx context.Context, r io.ReadCloser, deviceName string) error {
@@ -35,7 +104,10 @@ func (s *KOReaderPGStats) Write(ctx context.Context, r io.ReadCloser, deviceName
 		return err
 	}
 
-	go SyncDatabases(filepath, s.pg, deviceName)
+	go func() {
+		SyncDatabases(filepath, s.pg, deviceName)
+		s.invalidate()
+	}()
 	return nil
 }
 
@@ -48,11 +120,6 @@ type BookStats struct {
 
 func (s *KOReaderPGStats) GetBookStats(ctx context.Context, fileHash string) (*BookStats, error) {
 	query := `
-		WITH daily_reads AS (
-			SELECT DISTINCT DATE(start_time) as read_date
-			FROM stats_page_stat_data
-			WHERE koreader_partial_md5 = $1
-		)
 		SELECT 
 			COUNT(DISTINCT page) as total_read_pages,
 			SUM(duration) as total_read_time,
@@ -79,6 +146,12 @@ func (s *KOReaderPGStats) GetBookStats(ctx context.Context, fileHash string) (*B
 }
 
 func (s *KOReaderPGStats) GetGeneralStats(ctx context.Context, from, to time.Time) (*GeneralStats, error) {
+	key := statsCacheKey{kind: "general", from: from.UnixNano(), to: to.UnixNano()}
+	cached, generation, ok := s.cached(key)
+	if ok {
+		return cached.(*GeneralStats), nil
+	}
+
 	var stats GeneralStats
 
 	// Get per book statistics
@@ -123,6 +196,10 @@ func (s *KOReaderPGStats) GetGeneralStats(ctx context.Context, from, to time.Tim
 		stats.BookStats = append(stats.BookStats, bookStat)
 	}
 
+	if err := rows.Err(); err != nil {
+		return nil, fmt.Errorf("failed to read book stats: %w", err)
+	}
+
 	// Calculate days between dates for averages
 	days := to.Sub(from).Hours() / 24
 	if days > 0 {
@@ -130,6 +207,7 @@ func (s *KOReaderPGStats) GetGeneralStats(ctx context.Context, from, to time.Tim
 		stats.AverageTimePerDay = int(float64(stats.TotalReadTime)/days + 0.5)
 	}
 
+	s.store(key, generation, &stats)
 	return &stats, nil
 }
 
@@ -140,6 +218,12 @@ type DailyStats struct {
 }
 
 func (s *KOReaderPGStats) GetDailyStats(ctx context.Context, from, to time.Time) ([]DailyStats, error) {
+	key := statsCacheKey{kind: "daily", from: from.UnixNano(), to: to.UnixNano()}
+	cached, generation, ok := s.cached(key)
+	if ok {
+		return cached.([]DailyStats), nil
+	}
+
 	query := `
 		WITH RECURSIVE dates AS (
 			SELECT date_trunc('day', $1::timestamp)::date as date
@@ -178,6 +262,10 @@ func (s *KOReaderPGStats) GetDailyStats(ctx context.Context, from, to time.Time)
 		}
 		stats = append(stats, stat)
 	}
+	if err := rows.Err(); err != nil {
+		return nil, fmt.Errorf("failed to read daily stats: %w", err)
+	}
 
+	s.store(key, generation, stats)
 	return stats, nil
 }
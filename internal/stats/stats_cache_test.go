@@ -0,0 +1,26 @@
+package stats
+
+import "testing"
+
+func TestStatsCacheGeneration(t *testing.T) {
+	s := NewKOReaderPGStats(nil)
+	key := statsCacheKey{kind: "general"}
+
+	_, generation, ok := s.cached(key)
+	if ok {
+		t.Fatal("empty cache returned a value")
+	}
+	// a sync finishes while the query for key is still running
+	s.invalidate()
+	s.store(key, generation, 1)
+	if _, _, ok := s.cached(key); ok {
+		t.Error("result from before invalidate was cached")
+	}
+
+	_, generation, _ = s.cached(key)
+	s.store(key, generation, 2)
+	value, _, ok := s.cached(key)
+	if !ok || value != 2 {
+		t.Errorf("expected cached 2, got %v", value)
+	}
+}
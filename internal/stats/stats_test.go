@@ -0,0 +1,40 @@
+package stats_test
+
+import (
+	"context"
+	"testing"
+	"time"
+
+	"github.com/pashagolub/pgxmock/v4"
+	"github.com/stretchr/testify/assert"
+	"github.com/vanadium23/kompanion/internal/stats"
+	"github.com/vanadium23/kompanion/pkg/postgres"
+)
+
+func TestGeneralStatsCached(t *testing.T) {
+	pgmock, err := pgxmock.NewPool()
+	if err != nil {
+		t.Fatalf("failed to create pgxmock pool: %v", err)
+	}
+	defer pgmock.Close()
+
+	from := time.Date(2025, 1, 1, 0, 0, 0, 0, time.UTC)
+	to := from.AddDate(0, 1, 0).Add(-time.Second)
+
+	rows := pgxmock.NewRows([]string{"title", "total_read_pages", "total_read_time", "total_read_days"}).
+		AddRow("title", 10, 600, 2)
+	pgmock.ExpectQuery("SELECT (.+) FROM stats_page_stat_data").
+		WithArgs(from, to).
+		WillReturnRows(rows)
+
+	rs := stats.NewKOReaderPGStats(postgres.Mock(pgmock))
+
+	first, err := rs.GetGeneralStats(context.Background(), from, to)
+	assert.NoError(t, err)
+	second, err := rs.GetGeneralStats(context.Background(), from, to)
+	assert.NoError(t, err)
+
+	assert.Equal(t, 10, second.TotalReadPages)
+	assert.Same(t, first, second)
+	assert.NoError(t, pgmock.ExpectationsWereMet())
+}
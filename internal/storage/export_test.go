@@ -0,0 +1,8 @@
+package storage
+
+// SetReadChunkSize overrides the Postgres read chunk size and returns a func restoring it.
+func SetReadChunkSize(n int64) func() {
+	prev := readChunkSize
+	readChunkSize = n
+	return func() { readChunkSize = prev }
+}
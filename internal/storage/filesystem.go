@@ -4,9 +4,11 @@ import (
 	"context"
 	"errors"
 	"io"
+	"math/rand"
 	"os"
 	"path"
 	"path/filepath"
+	"strconv"
 	"strings"
 )
 
@@ -15,6 +17,8 @@ type FilesystemStorage struct {
 	root string
 }
 
+var _ Storage = (*FilesystemStorage)(nil)
+
 func NewFilesystemStorage(root string) (*FilesystemStorage, error) {
 	// Try to create the root directory
 	if !strings.HasSuffix(root, "/") {
@@ -36,15 +40,14 @@ func NewFilesystemStorage(root string) (*FilesystemStorage, error) {
 }
 
 func (s *FilesystemStorage) Read(ctx context.Context, p string) (*os.File, error) {
-	filepath := path.Join(s.root, p)
-	_, err := os.Stat(filepath)
+	file, err := os.Open(path.Join(s.root, p))
 	if errors.Is(err, os.ErrNotExist) {
 		return nil, ErrNotFound
 	}
 	if err != nil {
 		return nil, err
 	}
-	return os.Open(filepath)
+	return file, nil
 }
 
 func (s *FilesystemStorage) Write(ctx context.Context, src, dest string) error {
@@ -61,18 +64,56 @@ func (s *FilesystemStorage) Write(ctx context.Context, src, dest string) error {
 		return err
 	}
 
-	destFile, err := os.Create(dst)
+	// write next to the destination and rename, so readers never
+	// see a partially written file
+	tmpFile, err := createTemp(dst)
 	if err != nil {
 		return err
 	}
-	defer destFile.Close()
+	defer os.Remove(tmpFile.Name())
+	defer tmpFile.Close()
 
-	_, err = io.Copy(destFile, srcFile)
+	_, err = io.Copy(tmpFile, srcFile)
+	if err != nil {
+		return err
+	}
+	err = tmpFile.Sync()
+	if err != nil {
+		return err
+	}
+	err = tmpFile.Close()
 	if err != nil {
 		return err
 	}
 
-	return nil
+	err = os.Rename(tmpFile.Name(), dst)
+	if err != nil {
+		return err
+	}
+	return syncDir(dirPath)
+}
+
+// createTemp opens a new file next to dst. Unlike os.CreateTemp it
+// creates the file 0666 minus umask, the same mode os.Create gives.
+func createTemp(dst string) (*os.File, error) {
+	for try := 0; ; try++ {
+		name := dst + ".tmp-" + strconv.FormatUint(uint64(rand.Uint32()), 10)
+		f, err := os.OpenFile(name, os.O_RDWR|os.O_CREATE|os.O_EXCL, 0o666)
+		if errors.Is(err, os.ErrExist) && try < 10000 {
+			continue
+		}
+		return f, err
+	}
+}
+
+// syncDir flushes the directory entry, so a renamed file survives a crash.
+func syncDir(dirPath string) error {
+	dir, err := os.Open(dirPath)
+	if err != nil {
+		return err
+	}
+	defer dir.Close()
+	return dir.Sync()
 }
 
 func checkSystemWrites(root string) error {
@@ -51,3 +51,73 @@ func TestFilesystemStorage(t *testing.T) {
 		t.Errorf("Expected body %s, got %s", string(body), string(readBody))
 	}
 }
+
+func TestFilesystemStorageOverwrite(t *testing.T) {
+	ctx := context.Background()
+	tmpdir, err := os.MkdirTemp("", "")
+	if err != nil {
+		t.Fatalf("Error creating temp dir: %v", err)
+	}
+	defer os.RemoveAll(tmpdir)
+
+	st, err := storage.NewFilesystemStorage(tmpdir)
+	if err != nil {
+		t.Fatalf("Error creating filesystem storage: %v", err)
+	}
+
+	for _, body := range []string{"first version", "second"} {
+		tempFile, err := os.CreateTemp("", "")
+		if err != nil {
+			t.Fatalf("Error creating temp file: %v", err)
+		}
+		defer os.Remove(tempFile.Name())
+		_, err = tempFile.WriteString(body)
+		if err != nil {
+			t.Fatalf("Error writing to temp file: %v", err)
+		}
+
+		err = st.Write(ctx, tempFile.Name(), "books/test")
+		if err != nil {
+			t.Fatalf("Error writing file: %v", err)
+		}
+	}
+
+	entries, err := os.ReadDir(tmpdir + "/books")
+	if err != nil {
+		t.Fatalf("Error listing dir: %v", err)
+	}
+	if len(entries) != 1 {
+		t.Errorf("Expected only the stored file, got %d entries", len(entries))
+	}
+
+	// stored files get the same mode as os.Create under the current umask
+	created, err := os.Create(tmpdir + "/created")
+	if err != nil {
+		t.Fatalf("Error creating file: %v", err)
+	}
+	created.Close()
+	want, err := os.Stat(created.Name())
+	if err != nil {
+		t.Fatalf("Error stating file: %v", err)
+	}
+	info, err := os.Stat(tmpdir + "/books/test")
+	if err != nil {
+		t.Fatalf("Error stating file: %v", err)
+	}
+	if info.Mode().Perm() != want.Mode().Perm() {
+		t.Errorf("Expected mode %o, got %o", want.Mode().Perm(), info.Mode().Perm())
+	}
+
+	readFile, err := st.Read(ctx, "books/test")
+	if err != nil {
+		t.Fatalf("Error reading file: %v", err)
+	}
+	defer readFile.Close()
+	readBody, err := os.ReadFile(readFile.Name())
+	if err != nil {
+		t.Errorf("Error reading file: %v", err)
+	}
+	if string(readBody) != "second" {
+		t.Errorf("Expected body second, got %s", string(readBody))
+	}
+}
@@ -12,6 +12,8 @@ type MemoryStorage struct {
 	data map[string][]byte
 }
 
+var _ Storage = (*MemoryStorage)(nil)
+
 var ErrNotFound = errors.New("not found")
 
 func NewMemoryStorage() *MemoryStorage {
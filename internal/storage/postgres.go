@@ -1,18 +1,25 @@
 package storage
 
 import (
+	"bytes"
 	"context"
 	"fmt"
+	"io"
 	"os"
 
 	"github.com/vanadium23/kompanion/pkg/postgres"
 	"github.com/vanadium23/kompanion/pkg/utils"
 )
 
+// readChunkSize is how many bytes of a blob are fetched per query.
+var readChunkSize int64 = 4 << 20
+
 type PostgresStorage struct {
 	*postgres.Postgres
 }
 
+var _ Storage = (*PostgresStorage)(nil)
+
 func NewPostgresStorage(pg *postgres.Postgres) *PostgresStorage {
 	return &PostgresStorage{pg}
 }
@@ -27,7 +34,7 @@ func (ps *PostgresStorage) Write(
 		return err
 	}
 
-	md5Hash, err := utils.PartialMD5(source)
+	md5Hash, err := utils.PartialMD5FromReader(bytes.NewReader(data))
 	if err != nil {
 		return err
 	}
@@ -47,15 +54,15 @@ func (ps *PostgresStorage) Write(
 }
 
 func (ps *PostgresStorage) Read(ctx context.Context, filepath string) (*os.File, error) {
+	// size and first chunk come together, most books fit in a single chunk
 	sql := `
-		SELECT file_data
+		SELECT octet_length(file_data), substring(file_data from 1 for $2)
 		FROM storage_blob
 		WHERE file_path = $1
 	`
-	args := []interface{}{filepath}
-
-	var data []byte
-	err := ps.Pool.QueryRow(ctx, sql, args...).Scan(&data)
+	var size int64
+	var chunk []byte
+	err := ps.Pool.QueryRow(ctx, sql, filepath, readChunkSize).Scan(&size, &chunk)
 	if err != nil {
 		return nil, fmt.Errorf("PostgresStorage - Read - r.Pool.QueryRow: %w", err)
 	}
@@ -66,9 +73,32 @@ func (ps *PostgresStorage) Read(ctx context.Context, filepath string) (*os.File,
 		return nil, err
 	}
 	defer tempFile.Close()
-	_, err = tempFile.Write(data)
-	if err != nil {
-		return nil, err
+
+	// fetch the rest in chunks, so a whole book is never held in memory;
+	// blobs are append only, so the chunks can't change between queries
+	sql = `
+		SELECT substring(file_data from $2 for $3)
+		FROM storage_blob
+		WHERE file_path = $1
+	`
+	offset := int64(0)
+	for {
+		_, err = tempFile.Write(chunk)
+		if err != nil {
+			break
+		}
+		offset += int64(len(chunk))
+		if offset >= size {
+			return tempFile, nil
+		}
+		err = ps.Pool.QueryRow(ctx, sql, filepath, offset+1, readChunkSize).Scan(&chunk)
+		if err == nil && len(chunk) == 0 {
+			err = io.ErrUnexpectedEOF
+		}
+		if err != nil {
+			break
+		}
 	}
-	return tempFile, nil
+	os.Remove(tempFile.Name())
+	return nil, fmt.Errorf("PostgresStorage - Read - chunk at %d: %w", offset, err)
 }
@@ -44,10 +44,10 @@ func TestPostgresStorage(t *testing.T) {
 		err = store.Write(context.Background(), tmpfile.Name(), "test.txt")
 		require.NoError(t, err)
 
-		// Expect Read query
-		mock.ExpectQuery("SELECT file_data FROM storage_blob").
-			WithArgs("test.txt").
-			WillReturnRows(mock.NewRows([]string{"file_data"}).AddRow(content))
+		// Expect Read query: size and the whole file in the first chunk
+		mock.ExpectQuery("SELECT octet_length\\(file_data\\), substring\\(file_data from 1 for \\$2\\) FROM storage_blob").
+			WithArgs("test.txt", pgxmock.AnyArg()).
+			WillReturnRows(mock.NewRows([]string{"octet_length", "substring"}).AddRow(int64(len(content)), content))
 
 		// Test Read
 		readFile, err := store.Read(context.Background(), "test.txt")
@@ -72,8 +72,8 @@ func TestPostgresStorage(t *testing.T) {
 		store := storage.NewPostgresStorage(pg)
 
 		// Expect Read query to return no rows
-		mock.ExpectQuery("SELECT file_data FROM storage_blob").
-			WithArgs("non-existent.txt").
+		mock.ExpectQuery("SELECT octet_length\\(file_data\\), substring").
+			WithArgs("non-existent.txt", pgxmock.AnyArg()).
 			WillReturnError(pgx.ErrNoRows)
 
 		_, err = store.Read(context.Background(), "non-existent.txt")
@@ -83,6 +83,41 @@ func TestPostgresStorage(t *testing.T) {
 		require.NoError(t, err)
 	})
 
+	t.Run("read file in chunks", func(t *testing.T) {
+		// Setup mock
+		mock, err := pgxmock.NewPool()
+		require.NoError(t, err)
+		defer mock.Close()
+
+		pg := postgres.Mock(mock)
+		store := storage.NewPostgresStorage(pg)
+		defer storage.SetReadChunkSize(4)()
+
+		content := []byte("0123456789")
+
+		// Expect Read queries: size with the first chunk, then the rest by offset
+		mock.ExpectQuery("SELECT octet_length\\(file_data\\), substring\\(file_data from 1 for \\$2\\) FROM storage_blob").
+			WithArgs("test.txt", int64(4)).
+			WillReturnRows(mock.NewRows([]string{"octet_length", "substring"}).AddRow(int64(len(content)), content[:4]))
+		mock.ExpectQuery("SELECT substring\\(file_data from \\$2 for \\$3\\) FROM storage_blob").
+			WithArgs("test.txt", int64(5), int64(4)).
+			WillReturnRows(mock.NewRows([]string{"substring"}).AddRow(content[4:8]))
+		mock.ExpectQuery("SELECT substring\\(file_data from \\$2 for \\$3\\) FROM storage_blob").
+			WithArgs("test.txt", int64(9), int64(4)).
+			WillReturnRows(mock.NewRows([]string{"substring"}).AddRow(content[8:]))
+
+		readFile, err := store.Read(context.Background(), "test.txt")
+		require.NoError(t, err)
+		defer os.Remove(readFile.Name())
+
+		readContent, err := os.ReadFile(readFile.Name())
+		require.NoError(t, err)
+		assert.Equal(t, content, readContent)
+
+		err = mock.ExpectationsWereMet()
+		require.NoError(t, err)
+	})
+
 	t.Run("write non-existent file", func(t *testing.T) {
 		// Setup mock
 		mock, err := pgxmock.NewPool()
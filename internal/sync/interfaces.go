@@ -11,10 +11,12 @@ import (
 type ProgressRepo interface {
 	Store(ctx context.Context, t entity.Progress) error
 	GetBookHistory(ctx context.Context, bookID string, limit int) ([]entity.Progress, error)
+	GetLatestProgress(ctx context.Context, bookIDs []string) ([]entity.Progress, error)
 }
 
 // Progress -.
 type Progress interface {
 	Sync(context.Context, entity.Progress) (entity.Progress, error)
 	Fetch(ctx context.Context, bookID string) (entity.Progress, error)
+	FetchMany(ctx context.Context, bookIDs []string) (map[string]entity.Progress, error)
 }
@@ -50,6 +50,21 @@ func (mr *MockProgressRepoMockRecorder) GetBookHistory(ctx, bookID, limit interf
 	return mr.mock.ctrl.RecordCallWithMethodType(mr.mock, "GetBookHistory", reflect.TypeOf((*MockProgressRepo)(nil).GetBookHistory), ctx, bookID, limit)
 }
 
+// GetLatestProgress mocks base method.
+func (m *MockProgressRepo) GetLatestProgress(ctx context.Context, bookIDs []string) ([]entity.Progress, error) {
+	m.ctrl.T.Helper()
+	ret := m.ctrl.Call(m, "GetLatestProgress", ctx, bookIDs)
+	ret0, _ := ret[0].([]entity.Progress)
+	ret1, _ := ret[1].(error)
+	return ret0, ret1
+}
+
+// GetLatestProgress indicates an expected call of GetLatestProgress.
+func (mr *MockProgressRepoMockRecorder) GetLatestProgress(ctx, bookIDs interface{}) *gomock.Call {
+	mr.mock.ctrl.T.Helper()
+	return mr.mock.ctrl.RecordCallWithMethodType(mr.mock, "GetLatestProgress", reflect.TypeOf((*MockProgressRepo)(nil).GetLatestProgress), ctx, bookIDs)
+}
+
 // Store mocks base method.
 func (m *MockProgressRepo) Store(ctx context.Context, t entity.Progress) error {
 	m.ctrl.T.Helper()
@@ -102,6 +117,21 @@ func (mr *MockProgressMockRecorder) Fetch(ctx, bookID interface{}) *gomock.Call
 	return mr.mock.ctrl.RecordCallWithMethodType(mr.mock, "Fetch", reflect.TypeOf((*MockProgress)(nil).Fetch), ctx, bookID)
 }
 
+// FetchMany mocks base method.
+func (m *MockProgress) FetchMany(ctx context.Context, bookIDs []string) (map[string]entity.Progress, error) {
+	m.ctrl.T.Helper()
+	ret := m.ctrl.Call(m, "FetchMany", ctx, bookIDs)
+	ret0, _ := ret[0].(map[string]entity.Progress)
+	ret1, _ := ret[1].(error)
+	return ret0, ret1
+}
+
+// FetchMany indicates an expected call of FetchMany.
+func (mr *MockProgressMockRecorder) FetchMany(ctx, bookIDs interface{}) *gomock.Call {
+	mr.mock.ctrl.T.Helper()
+	return mr.mock.ctrl.RecordCallWithMethodType(mr.mock, "FetchMany", reflect.TypeOf((*MockProgress)(nil).FetchMany), ctx, bookIDs)
+}
+
 // Sync mocks base method.
 func (m *MockProgress) Sync(arg0 context.Context, arg1 entity.Progress) (entity.Progress, error) {
 	m.ctrl.T.Helper()
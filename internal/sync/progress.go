@@ -13,6 +13,8 @@ type ProgressSyncUseCase struct {
 	repo ProgressRepo
 }
 
+var _ Progress = (*ProgressSyncUseCase)(nil)
+
 // NewProgressSync -.
 func NewProgressSync(r ProgressRepo) *ProgressSyncUseCase {
 	return &ProgressSyncUseCase{
@@ -52,3 +54,20 @@ func (uc *ProgressSyncUseCase) Fetch(ctx context.Context, bookID string) (entity
 
 	return last, nil
 }
+
+// FetchMany -. latest progress keyed by book, books without progress are absent
+func (uc *ProgressSyncUseCase) FetchMany(ctx context.Context, bookIDs []string) (map[string]entity.Progress, error) {
+	docs, err := uc.repo.GetLatestProgress(ctx, bookIDs)
+	if err != nil {
+		return nil, fmt.Errorf("ProgressSyncUseCase - FetchMany - s.repo.GetLatestProgress: %w", err)
+	}
+
+	progress := make(map[string]entity.Progress, len(docs))
+	for _, doc := range docs {
+		// rewrite koreader device with our authed device
+		doc.Device = doc.AuthDeviceName
+		progress[doc.Document] = doc
+	}
+
+	return progress, nil
+}
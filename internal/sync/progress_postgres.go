@@ -14,6 +14,8 @@ type ProgressDatabaseRepo struct {
 	*postgres.Postgres
 }
 
+var _ ProgressRepo = (*ProgressDatabaseRepo)(nil)
+
 // New -.
 func NewProgressDatabaseRepo(pg *postgres.Postgres) *ProgressDatabaseRepo {
 	return &ProgressDatabaseRepo{pg}
@@ -65,3 +67,38 @@ func (r *ProgressDatabaseRepo) GetBookHistory(ctx context.Context, bookID string
 
 	return entities, nil
 }
+
+// GetLatestProgress -. latest progress of every given book in one query
+func (r *ProgressDatabaseRepo) GetLatestProgress(ctx context.Context, bookIDs []string) ([]entity.Progress, error) {
+	sql := `SELECT DISTINCT ON (koreader_partial_md5)
+			koreader_partial_md5, percentage, progress, koreader_device, koreader_device_id, created_at, auth_device_name
+		FROM sync_progress
+		WHERE koreader_partial_md5 = ANY($1)
+		ORDER BY koreader_partial_md5, created_at DESC`
+
+	rows, err := r.Pool.Query(ctx, sql, bookIDs)
+	if err != nil {
+		return nil, fmt.Errorf("ProgressDatabaseRepo - GetLatestProgress - r.Pool.Query: %w", err)
+	}
+	defer rows.Close()
+
+	entities := make([]entity.Progress, 0, len(bookIDs))
+
+	for rows.Next() {
+		e := entity.Progress{}
+		timestamp := time.Time{}
+
+		err = rows.Scan(&e.Document, &e.Percentage, &e.Progress, &e.Device, &e.DeviceID, &timestamp, &e.AuthDeviceName)
+		if err != nil {
+			return nil, fmt.Errorf("ProgressDatabaseRepo - GetLatestProgress - rows.Scan: %w", err)
+		}
+		e.Timestamp = timestamp.Unix()
+
+		entities = append(entities, e)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, fmt.Errorf("ProgressDatabaseRepo - GetLatestProgress - rows.Err: %w", err)
+	}
+
+	return entities, nil
+}
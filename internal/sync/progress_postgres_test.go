@@ -84,6 +84,38 @@ func TestProgressRepo_GetBookHistory(t *testing.T) {
 	}
 }
 
+func TestProgressRepo_GetLatestProgress(t *testing.T) {
+	mock, pdr := setupTestProgressDatabaseRepo()
+	defer mock.Close()
+
+	bookIDs := []string{"first-book", "second-book"}
+	now := time.Now()
+
+	rows := pgxmock.NewRows([]string{"koreader_partial_md5", "percentage", "progress", "koreader_device", "koreader_device_id", "created_at", "auth_device_name"}).
+		AddRow("first-book", 0.5, "some", "some", "test", now, "nothing")
+
+	mock.ExpectQuery("SELECT DISTINCT ON \\(koreader_partial_md5\\)").
+		WithArgs(bookIDs).
+		WillReturnRows(rows)
+
+	progress, err := pdr.GetLatestProgress(context.Background(), bookIDs)
+	if err != nil {
+		t.Fatalf("Unexpected error: %v", err)
+	}
+
+	if len(progress) != 1 {
+		t.Fatalf("Expected 1 progress record, got %d", len(progress))
+	}
+
+	if progress[0].Document != "first-book" {
+		t.Errorf("Expected document first-book, got %s", progress[0].Document)
+	}
+
+	if err := mock.ExpectationsWereMet(); err != nil {
+		t.Errorf("there were unfulfilled expectations: %s", err)
+	}
+}
+
 func setupTestProgressDatabaseRepo() (pgxmock.PgxPoolIface, *sync.ProgressDatabaseRepo) {
 	// создать mock
 	mock, err := pgxmock.NewPool()
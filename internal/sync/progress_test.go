@@ -76,6 +76,58 @@ func TestProgressFetch(t *testing.T) {
 	}
 }
 
+func TestProgressFetchMany(t *testing.T) {
+	t.Parallel()
+
+	progressSync, repo := mockedProgress(t)
+
+	bookIDs := []string{"bookID", "anotherBookID"}
+	errInternalServErr := errors.New("internal server error")
+
+	tests := []test{
+		{
+			name: "books with progress",
+			mock: func() {
+				repo.EXPECT().GetLatestProgress(context.Background(), bookIDs).Return(
+					[]entity.Progress{{
+						Document:       "bookID",
+						Device:         "koreader",
+						AuthDeviceName: "device",
+					}}, nil)
+			},
+			res: map[string]entity.Progress{
+				"bookID": {
+					Document:       "bookID",
+					Device:         "device",
+					AuthDeviceName: "device",
+				},
+			},
+			err: nil,
+		},
+		{
+			name: "result with error",
+			mock: func() {
+				repo.EXPECT().GetLatestProgress(context.Background(), bookIDs).Return(nil, errInternalServErr)
+			},
+			res: map[string]entity.Progress(nil),
+			err: errInternalServErr,
+		},
+	}
+
+	for _, tc := range tests {
+		tc := tc
+
+		t.Run(tc.name, func(t *testing.T) {
+			tc.mock()
+
+			res, err := progressSync.FetchMany(context.Background(), bookIDs)
+
+			require.Equal(t, tc.res, res)
+			require.ErrorIs(t, err, tc.err)
+		})
+	}
+}
+
 func TestProgressSync(t *testing.T) {
 	t.Parallel()
 
@@ -0,0 +1 @@
+DROP INDEX IF EXISTS auth_session_session_key_active_idx;
@@ -0,0 +1,3 @@
+-- session lookup on every authenticated web request, only active sessions are matched;
+-- keys are only compared by equality, a hash index stores a 4-byte hash code per entry
+CREATE INDEX auth_session_session_key_active_idx ON auth_session USING hash (session_key) WHERE is_active;
@@ -0,0 +1 @@
+DROP INDEX IF EXISTS sync_progress_partial_md5_created_at_idx;
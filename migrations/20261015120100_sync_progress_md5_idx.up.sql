@@ -0,0 +1,2 @@
+-- latest progress per document is fetched on every KOReader sync and book page
+CREATE INDEX sync_progress_partial_md5_created_at_idx ON sync_progress(koreader_partial_md5, created_at DESC);
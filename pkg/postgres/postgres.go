@@ -55,9 +55,19 @@ func New(url string, opts ...Option) (*Postgres, error) {
 	poolConfig.MaxConns = int32(pg.maxPoolSize)
 
 	for pg.connAttempts > 0 {
-		pg.Pool, err = pgxpool.NewWithConfig(context.Background(), poolConfig)
+		var pool *pgxpool.Pool
+		pool, err = pgxpool.NewWithConfig(context.Background(), poolConfig)
 		if err == nil {
-			break
+			// pool connects lazily, ping so an unreachable database
+			// is retried here instead of failing the first request
+			ctx, cancel := context.WithTimeout(context.Background(), pg.connTimeout)
+			err = pool.Ping(ctx)
+			cancel()
+			if err == nil {
+				pg.Pool = pool
+				break
+			}
+			pool.Close()
 		}
 
 		log.Printf("Postgres is trying to connect, attempts left: %d", pg.connAttempts)
@@ -21,9 +21,16 @@ func PartialMD5(filepath string) (string, error) {
 	}
 	defer file.Close()
 
+	return PartialMD5FromReader(file)
+}
+
+// PartialMD5FromReader is PartialMD5 over an already opened source,
+// e.g. an uploaded temp file or a file loaded into memory.
+func PartialMD5FromReader(r io.ReaderAt) (string, error) {
 	step := int64(1024)
 	size := 1024
 	hash := md5.New()
+	buf := make([]byte, size)
 
 	for i := -1; i <= 10; i++ {
 		offset := int64(0)
@@ -31,13 +38,7 @@ func PartialMD5(filepath string) (string, error) {
 			offset = step << (2 * i)
 		}
 
-		_, err := file.Seek(int64(offset), io.SeekStart)
-		if err != nil {
-			return "", err
-		}
-
-		buf := make([]byte, size)
-		n, err := file.Read(buf)
+		n, err := r.ReadAt(buf, offset)
 		if err != nil && err != io.EOF {
 			return "", err
 		}
@@ -1,7 +1,8 @@
 package utils_test
 
 import (
-	"fmt"
+	"bytes"
+	"os"
 	"testing"
 
 	"github.com/vanadium23/kompanion/pkg/utils"
@@ -9,11 +10,26 @@ import (
 
 func TestPartialMd5(t *testing.T) {
 	expected := "5ee88058c4346a122c4ccf80e36b1dc8"
-	actual, err := utils.PartialMD5("../../test/test_data/CrimePunishment-EPUB2.epub")
+	actual, err := utils.PartialMD5("../../test/test_data/books/CrimePunishment-EPUB2.epub")
 	if err != nil {
 		t.Fatalf("Error calculating MD5: %v", err)
 	}
-	if expected != fmt.Sprintf("%x", actual) {
-		t.Fatalf("Expected MD5 %s, got %x", expected, actual)
+	if expected != actual {
+		t.Fatalf("Expected MD5 %s, got %s", expected, actual)
+	}
+}
+
+func TestPartialMd5FromReader(t *testing.T) {
+	expected := "5ee88058c4346a122c4ccf80e36b1dc8"
+	data, err := os.ReadFile("../../test/test_data/books/CrimePunishment-EPUB2.epub")
+	if err != nil {
+		t.Fatalf("Error reading file: %v", err)
+	}
+	actual, err := utils.PartialMD5FromReader(bytes.NewReader(data))
+	if err != nil {
+		t.Fatalf("Error calculating MD5: %v", err)
+	}
+	if expected != actual {
+		t.Fatalf("Expected MD5 %s, got %s", expected, actual)
 	}
 }